@@ -30,8 +30,11 @@
 """
 
 import logging
+import os
+import shutil
 import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
@@ -51,6 +54,7 @@ class Config:
     zielpfad: Path = Path("./tex")
     vorlagepfad: Path = Path("content/vorlage-main.tex")
     filterpfad: Path = Path("content/combined-filter.lua")
+    max_prozesse: int = field(default_factory=lambda: os.cpu_count() or 1)
 
 
 class MarkdownConverter:
@@ -59,9 +63,22 @@ class MarkdownConverter:
     def __init__(self, config: Config):
         """Initialisiert den MarkdownConverter."""
         self.config = config
+        self._pandoc_ok: Optional[bool] = None
 
     def ist_pandoc_installiert(self) -> bool:
-        """Prüft, ob Pandoc auf dem System installiert ist."""
+        """Prüft, ob Pandoc auf dem System installiert ist.
+
+        Das Ergebnis wird zwischengespeichert, sodass Pandoc höchstens einmal gestartet wird.
+        """
+        if self._pandoc_ok is None:
+            self._pandoc_ok = self._pruefe_pandoc()
+        return self._pandoc_ok
+
+    def _pruefe_pandoc(self) -> bool:
+        """Führt die eigentliche Prüfung auf eine lauffähige Pandoc-Installation durch."""
+        if shutil.which("pandoc") is None:
+            logging.error("Pandoc ist nicht installiert")
+            return False
         try:
             subprocess.run(
                 ["pandoc", "--version"],
@@ -134,9 +151,19 @@ def finde_markdown_dateien(self, dateiname: Optional[str] = None) -> List[Path]:
             if not dateiname.endswith(".md"):
                 logging.error("Ungültige Dateiendung: %s", dateiname)
                 return []
-            return [self.config.quellpfad / dateiname]
-
-        return list(self.config.quellpfad.glob("*.md"))
+            md_pfad = self.config.quellpfad / dateiname
+            if not md_pfad.is_file():
+                logging.warning("Datei existiert nicht: %s", md_pfad)
+                return []
+            return [md_pfad]
+
+        # Ein einzelner scandir-Durchlauf liefert Name und Dateityp ohne weitere stat-Aufrufe
+        with os.scandir(self.config.quellpfad) as eintraege:
+            return [
+                Path(eintrag.path)
+                for eintrag in eintraege
+                if eintrag.name.endswith(".md") and eintrag.is_file(follow_symlinks=False)
+            ]
 
     def konvertiere_dateien(self, dateiname: Optional[str] = None) -> None:
         """Konvertiert ausgewählte oder alle Markdown-Dateien zu LaTeX.
@@ -152,13 +179,13 @@ def konvertiere_dateien(self, dateiname: Optional[str] = None) -> None:
             logging.warning("Keine Markdown-Dateien gefunden")
             return
 
-        for md_datei in md_dateien:
-            if not md_datei.exists():
-                logging.warning("Datei existiert nicht: %s", md_datei)
-                continue
+        auftraege = [
+            (md_datei, self.config.zielpfad / f"{md_datei.stem}.tex") for md_datei in md_dateien
+        ]
 
-            tex_datei = self.config.zielpfad / f"{md_datei.stem}.tex"
-            self.konvertiere_datei(md_datei, tex_datei)
+        # Pandoc-Prozesse parallel starten, damit sich deren Startzeit überlappt
+        with ThreadPoolExecutor(max_workers=self.config.max_prozesse) as executor:
+            list(executor.map(lambda auftrag: self.konvertiere_datei(*auftrag), auftraege))
 
         logging.info("Konvertierung abgeschlossen")
 
@@ -11,7 +11,7 @@
 
 Hauptfunktionen:
 - suche_und_ersetze: Ersetzt Muster in einer .tex-Datei
-- entferne_befehl: Entfernt einen bestimmten LaTeX-Befehl
+- entferne_befehl: Entfernt einen oder mehrere LaTeX-Befehle in einem Durchlauf
 - loesche_backup_dateien: Löscht alle .bak-Dateien im Verzeichnis
 - bearbeite_dateien: Verarbeitet .tex-Dateien im Verzeichnis
 - main: Hauptfunktion zur Steuerung des Ablaufs
@@ -36,9 +36,12 @@
 """
 
 import argparse
+import functools
 import glob
 import os
 import re
+from pathlib import Path
+from typing import Iterable
 
 # Konstanten als Großbuchstaben (Python-Konvention)
 VERZEICHNIS_PFAD = "./tex"
@@ -49,6 +52,9 @@
 SUCHMUSTER = r"\{\[\}@([^:]+:[^:]+:[^\]]+)\{\]\}"
 ERSATZMUSTER = r"\\textcite{\1}"
 
+# Puffergröße beim Schreiben (1 MiB) für weniger write()-Systemaufrufe
+SCHREIBPUFFER = 1 << 20
+
 
 def suche_und_ersetze(tex_pfad: str, suchmuster: str, ersetzen_durch: str) -> None:
     try:
@@ -59,26 +65,35 @@ def suche_und_ersetze(tex_pfad: str, suchmuster: str, ersetzen_durch: str) -> No
         backup_pfad = tex_pfad + ".bak"
         with open(backup_pfad, "w", encoding="utf-8") as backup_datei:
             backup_datei.write(inhalt)
-        with open(tex_pfad, "w", encoding="utf-8") as datei:
+        with open(tex_pfad, "w", encoding="utf-8", buffering=SCHREIBPUFFER) as datei:
             datei.write(inhalt)
     except IOError as e:
         print(f"Fehler beim Bearbeiten der Datei {tex_pfad}: {e}")
 
 
-def entferne_befehl(tex_pfad: str, befehl: str) -> None:
+@functools.lru_cache(maxsize=None)
+def _befehls_muster(befehle: tuple[str, ...]) -> re.Pattern[str]:
+    # Längste Befehle zuerst, damit Präfixe (z.B. \pass vor \passthrough) nicht vorgreifen
+    alternativen = sorted(befehle, key=len, reverse=True)
+    return re.compile("|".join(re.escape(befehl) for befehl in alternativen))
+
+
+def entferne_befehl(tex_pfad: str, *befehle: str) -> None:
     try:
         with open(tex_pfad, "r", encoding="utf-8") as datei:
             inhalt = datei.read()
-            if befehl in inhalt:
-                print(f"Befehl {befehl} gefunden in {tex_pfad}")
-            else:
-                print(f"Befehl {befehl} nicht gefunden in {tex_pfad}")
+            for befehl in befehle:
+                if befehl in inhalt:
+                    print(f"Befehl {befehl} gefunden in {tex_pfad}")
+                else:
+                    print(f"Befehl {befehl} nicht gefunden in {tex_pfad}")
 
         backup_pfad = tex_pfad + ".bak"
         with open(backup_pfad, "w", encoding="utf-8") as backup_datei:
             backup_datei.write(inhalt)
-        with open(tex_pfad, "w", encoding="utf-8") as datei:
-            datei.write(inhalt.replace(befehl, ""))
+        with open(tex_pfad, "w", encoding="utf-8", buffering=SCHREIBPUFFER) as datei:
+            # Alle Befehle in einem einzigen Durchlauf über den Inhalt entfernen
+            datei.write(_befehls_muster(befehle).sub("", inhalt))
     except IOError as e:
         print(f"Fehler beim Bearbeiten der Datei {tex_pfad}: {e}")
 
@@ -92,15 +107,16 @@ def loesche_backup_dateien() -> None:
 
 
 def bearbeite_dateien(spezifische_datei: str | None = None) -> None:
-    dateien = (
-        [os.path.join(VERZEICHNIS_PFAD, spezifische_datei + ".tex")]
+    # Generator statt Liste: die Bearbeitung beginnt, während noch gesucht wird
+    kandidaten: Iterable[Path] = (
+        [Path(VERZEICHNIS_PFAD, spezifische_datei + ".tex")]
         if spezifische_datei
-        else list(glob.iglob(os.path.join(VERZEICHNIS_PFAD, "*.tex")))
+        else Path(VERZEICHNIS_PFAD).glob("*.tex")
     )
+    dateien = (pfad for pfad in kandidaten if pfad.is_file())
     for tex_datei in dateien:
-        if os.path.isfile(tex_datei):
-            suche_und_ersetze(tex_datei, SUCHMUSTER, ERSATZMUSTER)
-            print(f"Datei {tex_datei} bearbeitet.")
+        suche_und_ersetze(str(tex_datei), SUCHMUSTER, ERSATZMUSTER)
+        print(f"Datei {tex_datei} bearbeitet.")
 
 
 def main() -> None:
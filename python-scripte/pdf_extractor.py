@@ -40,10 +40,13 @@
 
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from PyPDF2 import PdfReader, PdfWriter
 
+# Puffergröße beim Schreiben (1 MiB); PdfWriter schreibt objektweise in kleinen Stücken
+SCHREIBPUFFER = 1 << 20
+
 # Logging-Konfiguration
 logging.basicConfig(
     level=logging.INFO,
@@ -52,7 +55,7 @@
 )
 
 
-def get_pdf_info(pdf_pfad: str) -> Dict[str, Any]:
+def get_pdf_info(pdf_pfad: str) -> Tuple[PdfReader, Dict[str, Any]]:
     """
     Liest grundlegende Informationen aus einer PDF-Datei.
 
@@ -60,24 +63,32 @@ def get_pdf_info(pdf_pfad: str) -> Dict[str, Any]:
         pdf_pfad: Pfad zur PDF-Datei
 
     Returns:
-        Dict mit Metadaten und Seitenanzahl
+        Tupel aus dem geöffneten PdfReader (zur Wiederverwendung in
+        extrahiere_kapitel) und einem Dict mit Metadaten und Seitenanzahl
     """
-    with open(pdf_pfad, "rb") as f:
-        pdf = PdfReader(f)
-        return {"seiten": len(pdf.pages), "metadata": pdf.metadata}
+    pdf = PdfReader(pdf_pfad)
+    return pdf, {"seiten": len(pdf.pages), "metadata": pdf.metadata}
 
 
 def validiere_eingaben(
-    eingangs_pdf: str, startseite: int, endseite: int, max_size_mb: int = 100
+    eingangs_pdf: str,
+    startseite: int,
+    endseite: int,
+    reader: Optional[PdfReader] = None,
+    max_seiten: int = 1000,
 ) -> bool:
     """
     Erweiterte Prüfung der Benutzereingaben auf Gültigkeit.
 
+    Statt der Dateigröße wird die Anzahl der angeforderten Seiten begrenzt,
+    da nur diese Seiten tatsächlich verarbeitet werden.
+
     Args:
         eingangs_pdf: Pfad zur PDF-Datei
         startseite: Gewählte Startseite
         endseite: Gewählte Endseite
-        max_size_mb: Maximale erlaubte Dateigröße in MB
+        reader: Optional - bereits geöffneter PdfReader zur Prüfung der Seitenanzahl
+        max_seiten: Maximale Anzahl zu extrahierender Seiten
 
     Returns:
         True wenn alle Eingaben gültig sind
@@ -86,17 +97,13 @@ def validiere_eingaben(
         ValueError: Bei ungültigen Eingaben
     """
     # Prüfe Dateiexistenz
-    if not os.path.exists(eingangs_pdf):
+    if reader is None and not os.path.exists(eingangs_pdf):
         raise ValueError(f"Die Datei '{eingangs_pdf}' existiert nicht.")
 
     # Prüfe Dateiendung
     if not eingangs_pdf.lower().endswith(".pdf"):
         raise ValueError(f"Die Datei '{eingangs_pdf}' ist keine PDF-Datei.")
 
-    # Prüfe Dateigröße
-    if os.path.getsize(eingangs_pdf) > max_size_mb * 1024 * 1024:
-        raise ValueError(f"Die PDF-Datei ist größer als {max_size_mb}MB.")
-
     # Prüfe Seitenzahlen
     if startseite > endseite:
         raise ValueError("Die Startseite muss kleiner oder gleich der Endseite sein.")
@@ -104,6 +111,13 @@ def validiere_eingaben(
     if startseite < 1:
         raise ValueError("Die Startseite muss mindestens 1 sein.")
 
+    if reader is not None and endseite > len(reader.pages):
+        raise ValueError(f"Die Endseite darf höchstens {len(reader.pages)} sein.")
+
+    # Prüfe Umfang der Extraktion
+    if endseite - startseite + 1 > max_seiten:
+        raise ValueError(f"Es können höchstens {max_seiten} Seiten extrahiert werden.")
+
     return True
 
 
@@ -114,6 +128,7 @@ def extrahiere_kapitel(
     endseite: int,
     komprimieren: bool = False,
     progress_anzeige: bool = True,
+    reader: Optional[PdfReader] = None,
 ) -> None:
     """
     Extrahiert einen Seitenbereich aus einer PDF-Datei und speichert diesen in einer neuen PDF.
@@ -125,6 +140,8 @@ def extrahiere_kapitel(
         endseite: Letzte zu extrahierende Seite (beginnend bei 1)
         komprimieren: Optional - PDF-Inhalt komprimieren
         progress_anzeige: Optional - Fortschrittsbalken anzeigen
+        reader: Optional - bereits geöffneter PdfReader der Eingabe-PDF,
+            vermeidet erneutes Einlesen und Parsen der Datei
 
     Returns:
         None
@@ -135,8 +152,9 @@ def extrahiere_kapitel(
         ValueError: Wenn ungültige Seitenzahlen angegeben wurden
     """
     try:
-        # Initialisiere PDF Reader und Writer
-        reader = PdfReader(eingangs_pdf_pfad)
+        # Initialisiere PDF Reader (falls nicht übergeben) und Writer
+        if reader is None:
+            reader = PdfReader(eingangs_pdf_pfad)
         writer = PdfWriter()
 
         # Übertrage Metadaten wenn vorhanden
@@ -159,19 +177,21 @@ def extrahiere_kapitel(
         # Extrahiere die gewählten Seiten mit Fortschrittsanzeige
         total_seiten = endseite - startseite + 1
         logging.info(f"Beginne Extraktion von {total_seiten} Seiten...")
+        bereich_ende = endseite_index + 1  # exklusive Obergrenze des Seitenbereichs
 
-        for idx, seitennummer in enumerate(range(startseite_index, endseite_index + 1)):
-            page = reader.pages[seitennummer]
-
-            # Optional: Komprimiere Seiteninhalt
-            if komprimieren:
+        if komprimieren:
+            # Komprimierung erfordert Zugriff auf jede einzelne Seite
+            seiten = reader.pages[startseite_index:bereich_ende]
+            for idx, page in enumerate(seiten):
                 page.compress_content_streams()
+                writer.add_page(page)
 
-            writer.add_page(page)
-
-            # Zeige Fortschritt bei größeren PDFs
-            if progress_anzeige and total_seiten > 10:
-                print(f"\rVerarbeite Seite {idx + 1}/{total_seiten}", end="")
+                # Zeige Fortschritt bei größeren PDFs
+                if progress_anzeige and total_seiten > 10:
+                    print(f"\rVerarbeite Seite {idx + 1}/{total_seiten}", end="")
+        else:
+            # Ohne Komprimierung übernimmt PyPDF2 den gesamten Seitenbereich am Stück
+            writer.append(reader, pages=(startseite_index, bereich_ende))
 
         # Stelle sicher, dass das Ausgabeverzeichnis existiert
         ausgabe_verzeichnis = os.path.dirname(ausgangs_pdf_pfad)
@@ -179,11 +199,11 @@ def extrahiere_kapitel(
             os.makedirs(ausgabe_verzeichnis)
 
         # Speichere die neue PDF
-        with open(ausgangs_pdf_pfad, "wb") as ausgabe_pdf:
+        with open(ausgangs_pdf_pfad, "wb", buffering=SCHREIBPUFFER) as ausgabe_pdf:
             writer.write(ausgabe_pdf)
 
         # Beende Fortschrittsanzeige
-        if progress_anzeige and total_seiten > 10:
+        if komprimieren and progress_anzeige and total_seiten > 10:
             print()  # Neue Zeile nach Fortschrittsbalken
 
         # Erfolgsmeldung mit Details
@@ -192,8 +212,8 @@ def extrahiere_kapitel(
         logging.info(f"  Anzahl Seiten: {total_seiten}")
 
         if komprimieren:
-            original_size = os.path.getsize(eingangs_pdf_pfad) / 1024 / 1024
-            new_size = os.path.getsize(ausgangs_pdf_pfad) / 1024 / 1024
+            original_size = os.stat(eingangs_pdf_pfad).st_size / 1024 / 1024
+            new_size = os.stat(ausgangs_pdf_pfad).st_size / 1024 / 1024
             logging.info(f"  Dateigröße: {new_size:.1f}MB (Original: {original_size:.1f}MB)")
 
     except FileNotFoundError:
@@ -221,7 +241,7 @@ def extrahiere_kapitel(
         ausgangs_pdf = "pdf_extraktion.pdf"
 
         # PDF-Informationen auslesen
-        pdf_info = get_pdf_info(eingangs_pdf)
+        reader, pdf_info = get_pdf_info(eingangs_pdf)
         max_seiten = pdf_info["seiten"]
 
         # Benutzereingaben mit Standardwerten
@@ -234,11 +254,16 @@ def extrahiere_kapitel(
         komprimieren = input("PDF komprimieren? (j/N): ").lower() == "j"
 
         # Eingaben validieren
-        validiere_eingaben(eingangs_pdf, startseite, endseite)
+        validiere_eingaben(eingangs_pdf, startseite, endseite, reader=reader)
 
         # Kapitel extrahieren
         extrahiere_kapitel(
-            eingangs_pdf, ausgangs_pdf, startseite, endseite, komprimieren=komprimieren
+            eingangs_pdf,
+            ausgangs_pdf,
+            startseite,
+            endseite,
+            komprimieren=komprimieren,
+            reader=reader,
         )
 
     except ValueError as e:
@@ -6,20 +6,25 @@
 Hauptfunktionalitäten:
 1. Konfiguration über eine Config-Klasse
 2. Verarbeitung von .tex-Dateien mit verschiedenen Transformationen
-3. Multithreading für parallele Verarbeitung mehrerer Dateien
+3. Parallele Verarbeitung mehrerer Dateien in mehreren Prozessen
 4. Umfangreiche Fehlerbehandlung und Logging
+5. Überspringen unveränderter Dateien anhand eines Manifests (.tex.suchen_ersetzen_manifest.json)
 
 Hauptkomponenten:
 - Config: Dataclass für die Konfiguration der Verarbeitung
 - LatexProcessor: Klasse zur Verarbeitung von LaTeX-Dateien
 
 Verwendung:
-    python suchen_ersetzen.py [--tex-dir VERZEICHNIS] [--verbose]
+    python suchen_ersetzen.py [--tex-dir VERZEICHNIS] [--force] [--verbose]
 
 Args:
     --tex-dir: Optionaler Pfad zum Verzeichnis mit .tex-Dateien (Standard: ./tex)
+    --force: Verarbeitet auch Dateien, die seit dem letzten Lauf unverändert sind
     --verbose: Aktiviert ausführliche Logging-Ausgaben
 
+Umgebungsvariablen:
+    LATEX_WORKERS: Anzahl paralleler Worker-Prozesse (Standard: Anzahl CPU-Kerne)
+
 Die Verarbeitung umfasst:
 - Hinzufügen oder Ersetzen von Zeitstempel-Kommentaren
 - Aktualisierung von figure-Umgebungen
@@ -41,13 +46,20 @@
 
 import argparse
 import datetime
+import json
 import logging
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Match, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Match, Set, Tuple
+
+# Manifest neben dem tex-Verzeichnis (nicht darin, sonst wird es beim Synchronisieren von tex/
+# mitkopiert): Dateiname -> [mtime in ns, Größe] nach der letzten Verarbeitung
+MANIFEST_SUFFIX = ".suchen_ersetzen_manifest.json"
+ManifestEntry = Tuple[str, int, int]
 
 # Logging-Konfiguration
 logging.basicConfig(
@@ -66,12 +78,14 @@ class Config:
     label_replacements: Dict[str, str]
     default_image_width: str = "0.8"
     default_image_height: str = "0.6"
+    force: bool = False
 
     @classmethod
-    def create_default(cls, tex_dir: str = "./tex") -> "Config":
+    def create_default(cls, tex_dir: str = "./tex", force: bool = False) -> "Config":
         """Erstellt eine Standardkonfiguration."""
         return cls(
             tex_dir=Path(tex_dir),
+            force=force,
             timestamp=datetime.datetime.now().strftime("%d-%b-%y"),
             label_replacements={
                 "uxfc": "ue",
@@ -86,75 +100,197 @@ class LatexProcessor:
     """Klasse zur Verarbeitung von LaTeX-Dateien."""
 
     # Typ-Alias für Transformationsfunktionen
-    TransformFunc = Callable[..., str]
+    TransformFunc = Callable[..., bytes]
     TransformationType = Tuple[TransformFunc, Dict[str, Any]]
 
     def __init__(self, config: Config):
         """Initialisiert den LatexProcessor."""
         self.config = config
-        self.table_patterns = {
-            "toprule": r"\\toprule\\noalign{}\n",
-            "endhead": r"\\noalign{}\n\\endhead\n",
-            "bottomrule": r"\\bottomrule\\noalign{}\n\\endlastfoot\n",
-        }
+        # Alle Muster arbeiten auf den rohen UTF-8-Bytes der Dateien; die gesuchte
+        # LaTeX-Syntax ist reines ASCII, ein Dekodieren/Kodieren entfällt dadurch
+        self._compile_text_patterns()
+        self._compile_table_patterns()
+
+    def _compile_text_patterns(self) -> None:
+        """Kompiliert die Muster für Text-, Label-, Code- und Mathematik-Ersetzungen."""
         self.simple_replacements = {
-            ",height=\\textheight": "",
-            "``": ">>",
-            "''": "<<",
-            "\\tightlist": "",
-            "\\midrule": "\\midrule[\\heavyrulewidth]\n",
+            b",height=\\textheight": b"",
+            b"``": b">>",
+            b"''": b"<<",
+            b"\\tightlist": b"",
+            b"\\midrule": b"\\midrule[\\heavyrulewidth]\n",
         }
         # Vorkompilierte reguläre Ausdrücke für bessere Performance
         self._figure_pattern = re.compile(
-            r"(\\begin{figure}\s*\\centering\s*)(\\includegraphics)(\[.*?\])?(\{.*?\})",
+            rb"(\\begin{figure}\s*\\centering\s*)(\\includegraphics)(\[.*?\])?(\{.*?\})",
             re.DOTALL,
         )
-        self._label_pattern = re.compile(r"\\label{([^}]*?)}")
-        self._code_pattern = re.compile(r"\\passthrough{\\lstinline!(.*?)!}")
+        # Bildoptionen sind für den ganzen Lauf konstant und werden nur einmal formatiert
+        self._image_options = self._create_image_options()
+        self._label_pattern = re.compile(rb"\\label{([^}]*?)}")
+        self._label_replacements = tuple(
+            (char.encode(), replacement.encode())
+            for char, replacement in self.config.label_replacements.items()
+        )
+        self._code_pattern = re.compile(rb"\\passthrough{\\lstinline!(.*?)!}")
+        self._math_pattern = re.compile(rb"\\\(|\\\)")
+        self._pandoc_pattern = re.compile(rb"\\pandocbounded\{(.*?)\}")
+        self._ju_comment_pattern = re.compile(rb"(?m)^[ \t]*% ju.*(?:\n|$)")
+
+    def _compile_table_patterns(self) -> None:
+        """Kompiliert die Muster für die Tabellenumwandlung."""
+        self.table_patterns = {
+            "toprule": re.compile(rb"\\toprule\\noalign{}\n"),
+            "endhead": re.compile(rb"\\noalign{}\n\\endhead\n"),
+            "bottomrule": re.compile(rb"\\bottomrule\\noalign{}\n\\endlastfoot\n"),
+        }
+        # Gebundene sub-Methoden, erspart die Attributsuche in der Schleife
+        self._table_subs = tuple(pattern.sub for pattern in self.table_patterns.values())
+        # Possessive Quantoren (Python >= 3.11) statt ".*?": Die Gruppen laufen bis zum ersten
+        # Endmarker und geben nichts zurück, damit kein Backtracking bei fehlerhaftem LaTeX
         self._longtable_pattern = re.compile(
-            r"\\begin{longtable}\[\]{@{}(.*?)@{}}(.*?)\\end{longtable}", re.DOTALL
+            rb"\\begin{longtable}\[\]{@{}((?:[^@]++|@(?!{}}))*+)@{}}"
+            rb"((?:[^\\]++|\\(?!end{longtable}))*+)\\end{longtable}"
+        )
+        self._adjust_tabular_pattern = re.compile(
+            rb"\\begin{tabular}{@{}\s*+>\s*+{\\raggedright"
+            rb"(?:[^\\]++|\\(?!end{tabular}))*+\\end{tabular}"
         )
-        self._table_content_pattern = re.compile(r"\\toprule(.*?)\\bottomrule", re.DOTALL)
+        self._table_content_pattern = re.compile(rb"\\toprule(.*?)\\bottomrule", re.DOTALL)
         self._minipage_pattern = re.compile(
-            r"\\begin{minipage}\[.*?\]{.*?}\\raggedright|\\end{minipage}"
+            rb"\\begin{minipage}\[.*?\]{.*?}\\raggedright|\\end{minipage}"
         )
-        self._math_pattern = re.compile(r"\\\(|\\\)")
-        self._pandoc_pattern = re.compile(r"\\pandocbounded\{(.*?)\}")
 
     def process_files(self) -> None:
-        """Verarbeitet alle .tex-Dateien im konfigurierten Verzeichnis."""
+        """Verarbeitet alle .tex-Dateien im konfigurierten Verzeichnis parallel."""
         try:
-            os.chdir(self.config.tex_dir)
-            logging.info("Verarbeite Dateien in: %s", self.config.tex_dir)
-
-            tex_files = list(Path(".").glob("*.tex"))
-            if not tex_files:
+            tex_dir = self.config.tex_dir.resolve()
+            logging.info("Verarbeite Dateien in: %s", tex_dir)
+
+            manifest = {} if self.config.force else self._load_manifest(tex_dir)
+            counts: Dict[str, int] = {"gefunden": 0, "uebersprungen": 0}
+            vorhanden: Set[str] = set()
+            pending = self._iter_pending_files(tex_dir, manifest, counts, vorhanden)
+
+            with ProcessPoolExecutor(
+                max_workers=_anzahl_worker(),
+                initializer=_init_worker,
+                initargs=(self.config,),
+            ) as executor:
+                for entry in executor.map(_process_in_worker, pending, chunksize=4):
+                    if entry:
+                        name, mtime_ns, size = entry
+                        manifest[name] = [mtime_ns, size]
+
+            # Einträge gelöschter oder umbenannter Dateien nicht weiterführen
+            manifest = {name: entry for name, entry in manifest.items() if name in vorhanden}
+            self._save_manifest(tex_dir, manifest)
+            if not counts["gefunden"]:
                 logging.warning("Keine .tex-Dateien gefunden!")
                 return
-
-            logging.info("Gefundene .tex-Dateien: %d", len(tex_files))
-            for file_path in tex_files:
-                self._process_single_file(file_path)
+            logging.info("Gefundene .tex-Dateien: %d", counts["gefunden"])
+            if counts["uebersprungen"]:
+                logging.info(
+                    "Seit dem letzten Lauf unverändert, übersprungen: %d", counts["uebersprungen"]
+                )
 
         except OSError as e:
             logging.error("Fehler beim Zugriff auf Verzeichnis: %s", e)
             sys.exit(1)
-        finally:
-            os.chdir("..")
 
-    def _process_single_file(self, file_path: Path) -> None:
-        """Verarbeitet eine einzelne .tex-Datei."""
+    def _process_single_file(self, file_path: Path) -> ManifestEntry | None:
+        """Verarbeitet eine einzelne .tex-Datei.
+
+        Returns:
+            Manifest-Eintrag (Name, mtime in ns, Größe) nach der Verarbeitung, None bei Fehlern;
+            schlägt eine Transformation fehl, wird die Datei beim nächsten Lauf erneut verarbeitet
+        """
         logging.info("Verarbeite: %s", file_path)
         try:
-            content = file_path.read_text(encoding="utf-8")
-            content = self._apply_all_transformations(content, file_path.name)
-            file_path.write_text(content, encoding="utf-8")
-            logging.info("✓ Erfolgreich verarbeitet: %s", file_path)
+            original = file_path.read_bytes()
+            content, erfolgreich = self._apply_all_transformations(original, file_path.name)
+            if content != original:
+                file_path.write_bytes(content)
+            if not erfolgreich:
+                logging.warning("Unvollständig verarbeitet, wird wiederholt: %s", file_path)
+                return None
+            if content == original:
+                logging.info("✓ Keine Änderungen: %s", file_path)
+            else:
+                logging.info("✓ Erfolgreich verarbeitet: %s", file_path)
+            stat = file_path.stat()
+            return file_path.name, stat.st_mtime_ns, stat.st_size
         except Exception as e:
             logging.error("Fehler bei der Verarbeitung von %s: %s", file_path, e)
+            return None
+
+    @classmethod
+    def _iter_pending_files(
+        cls,
+        tex_dir: Path,
+        manifest: Dict[str, List[int]],
+        counts: Dict[str, int],
+        vorhanden: Set[str],
+    ) -> Iterator[Path]:
+        """Liefert die zu verarbeitenden .tex-Dateien, ohne das Verzeichnis vorab aufzulisten.
+
+        Args:
+            tex_dir: Verzeichnis mit den .tex-Dateien
+            manifest: Manifest bereits verarbeiteter Dateien
+            counts: Zähler für gefundene und übersprungene Dateien, wird fortlaufend aktualisiert
+            vorhanden: Namen aller gefundenen .tex-Dateien, wird fortlaufend ergänzt
+        """
+        with os.scandir(tex_dir) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.endswith(".tex") or not dir_entry.is_file():
+                    continue
+                counts["gefunden"] += 1
+                vorhanden.add(dir_entry.name)
+                if cls._is_unchanged(dir_entry, manifest):
+                    counts["uebersprungen"] += 1
+                    continue
+                yield Path(dir_entry.path)
+
+    @staticmethod
+    def _is_unchanged(dir_entry: os.DirEntry, manifest: Dict[str, List[int]]) -> bool:
+        """Prüft, ob eine Datei seit ihrer letzten Verarbeitung unverändert ist."""
+        entry = manifest.get(dir_entry.name)
+        if not entry:
+            return False
+        stat = dir_entry.stat()
+        return entry == [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def _manifest_path(tex_dir: Path) -> Path:
+        """Liefert den Pfad des Manifests, z. B. .tex.suchen_ersetzen_manifest.json neben tex/."""
+        return tex_dir.parent / f".{tex_dir.name}{MANIFEST_SUFFIX}"
 
-    def _apply_all_transformations(self, content: str, filename: str) -> str:
-        """Wendet alle Transformationen auf den Inhalt an."""
+    @classmethod
+    def _load_manifest(cls, tex_dir: Path) -> Dict[str, List[int]]:
+        """Lädt das Manifest bereits verarbeiteter Dateien."""
+        try:
+            with open(cls._manifest_path(tex_dir), "r", encoding="utf-8") as f:
+                manifest: Dict[str, List[int]] = json.load(f)
+                return manifest
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_manifest(cls, tex_dir: Path, manifest: Dict[str, List[int]]) -> None:
+        """Speichert das Manifest bereits verarbeiteter Dateien."""
+        try:
+            with open(cls._manifest_path(tex_dir), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logging.warning("Manifest konnte nicht gespeichert werden: %s", e)
+
+    def _apply_all_transformations(self, content: bytes, filename: str) -> Tuple[bytes, bool]:
+        """Wendet alle Transformationen auf den Inhalt an.
+
+        Returns:
+            Transformierter Inhalt und ob alle Transformationen fehlerfrei waren
+        """
+        erfolgreich = True
         transformations: list[LatexProcessor.TransformationType] = [
             (self._add_or_replace_comment, {"filename": filename}),
             (self._update_figure_environment, {}),
@@ -176,131 +312,164 @@ def _apply_all_transformations(self, content: str, filename: str) -> str:
                     transform_func.__name__,
                     e,
                 )
+                erfolgreich = False
 
-        return content
+        return content, erfolgreich
 
     # Die Typdeklarationen der Transformationsmethoden präzisieren
-    def _add_or_replace_comment(self, content: str, filename: str) -> str:
+    def _add_or_replace_comment(self, content: bytes, filename: str) -> bytes:
         """Fügt einen Zeitstempel-Kommentar hinzu oder ersetzt ihn."""
-        new_comment = f"% ju {self.config.timestamp} {filename}"
-        lines = [line for line in content.splitlines() if not line.strip().startswith("% ju")]
-        return "\n".join([new_comment] + lines)
+        new_comment = f"% ju {self.config.timestamp} {filename}\n".encode()
+        return new_comment + self._ju_comment_pattern.sub(b"", content)
 
-    def _update_figure_environment(self, content: str) -> str:
+    def _update_figure_environment(self, content: bytes) -> bytes:
         """Aktualisiert die figure-Umgebung mit standardisierten Größenangaben."""
+        # Günstige Teilzeichenkettensuche, erspart den Regex-Durchlauf ohne Treffer
+        if b"\\begin{figure}" not in content:
+            return content
         return self._figure_pattern.sub(self._repl_figure, content)
 
-    def _repl_figure(self, match: Match[str]) -> str:
+    def _repl_figure(self, match: Match[bytes]) -> bytes:
         """Hilfsfunktion für figure-Ersetzung."""
         before, includegraphics, options, path = match.groups()
         if not options:
-            options = self._create_image_options()
-        elif "width=" not in options and "height=" not in options:
-            options = options[:-1] + "," + self._create_image_options()[1:]
+            options = self._image_options
+        elif b"width=" not in options and b"height=" not in options:
+            options = options[:-1] + b"," + self._image_options[1:]
 
-        return f"{before}{includegraphics}{options}{path}\n" "%\\floatnotes{}\n" "%\\label{fig:}"
+        return before + includegraphics + options + path + b"\n%\\floatnotes{}\n%\\label{fig:}"
 
-    def _create_image_options(self) -> str:
+    def _create_image_options(self) -> bytes:
         """Erstellt die Standardoptionen für Bilder."""
         return (
             f"[width={self.config.default_image_width}\\textwidth,"
             f"height={self.config.default_image_height}\\textheight,keepaspectratio]"
-        )
+        ).encode()
 
-    def _apply_simple_replacements(self, content: str) -> str:
+    def _apply_simple_replacements(self, content: bytes) -> bytes:
         """Wendet einfache Textersetzungen an."""
         for old, new in self.simple_replacements.items():
             content = content.replace(old, new)
         return content
 
-    def _replace_german_chars_in_labels(self, content: str) -> str:
+    def _replace_german_chars_in_labels(self, content: bytes) -> bytes:
         """Ersetzt deutsche Sonderzeichen in Labels."""
+        if b"\\label{" not in content:
+            return content
+
+        replacements = self._label_replacements
 
-        def replacer(match: Match[str]) -> str:
+        def replacer(match: Match[bytes]) -> bytes:
             label_content = match.group(1)
-            for char, replacement in self.config.label_replacements.items():
+            for char, replacement in replacements:
                 label_content = label_content.replace(char, replacement)
-            return f"\\label{{{label_content}}}"
+            return b"\\label{" + label_content + b"}"
 
         return self._label_pattern.sub(replacer, content)
 
-    def _convert_code_blocks(self, content: str) -> str:
+    def _convert_code_blocks(self, content: bytes) -> bytes:
         """Konvertiert Code-Blöcke."""
-        return self._code_pattern.sub(r"\\verb|\1|", content)
+        if b"\\passthrough{\\lstinline!" not in content:
+            return content
+        return self._code_pattern.sub(rb"\\verb|\1|", content)
 
-    def _convert_longtable_to_table(self, content: str) -> str:
+    def _convert_longtable_to_table(self, content: bytes) -> bytes:
         """Konvertiert longtable zu normalen Tabellen."""
+        if b"\\begin{longtable}" not in content:
+            return content
 
-        def replacer(match: Match[str]) -> str:
+        def replacer(match: Match[bytes]) -> bytes:
             col_defs, table_content = match.groups()
             clean_content = self._clean_table_content(table_content)
             return self._create_table_environment(col_defs, clean_content)
 
         return self._longtable_pattern.sub(replacer, content)
 
-    def _clean_table_content(self, content: str) -> str:
+    def _clean_table_content(self, content: bytes) -> bytes:
         """Bereinigt den Tabelleninhalt."""
-        for pattern in self.table_patterns.values():
-            content = re.sub(pattern, "", content)
+        for sub in self._table_subs:
+            content = sub(b"", content)
         return content
 
-    def _create_table_environment(self, col_defs: str, content: str) -> str:
+    def _create_table_environment(self, col_defs: bytes, content: bytes) -> bytes:
         """Erstellt eine neue Tabellenumgebung."""
         return (
-            "\\begin{table}[ht]\n"
-            "  %\\caption{}\n"
-            "  %\\label{tab:my-table}\n"
-            f"  \\begin{{tabular}}{{@{{}}{col_defs}@{{}}}}\n"
-            "  \\toprule\n"
-            f"{content}"
-            "  \\bottomrule\n"
-            "  \\end{tabular}%\n"
-            "\\end{table}"
+            b"\\begin{table}[ht]\n"
+            b"  %\\caption{}\n"
+            b"  %\\label{tab:my-table}\n"
+            b"  \\begin{tabular}{@{}" + col_defs + b"@{}}\n"
+            b"  \\toprule\n" + content + b"  \\bottomrule\n"
+            b"  \\end{tabular}%\n"
+            b"\\end{table}"
         )
 
-    def _adjust_table_format(self, content: str) -> str:
+    def _adjust_table_format(self, content: bytes) -> bytes:
         """Passt das Tabellenformat an."""
-        pattern = re.compile(
-            r"\\begin{tabular}{@{}\s*>\s*{\\raggedright.*?\\end{tabular}", re.DOTALL
-        )
-        return pattern.sub(self._adjust_table_structure, content)
+        if b"\\begin{tabular}" not in content:
+            return content
+        return self._adjust_tabular_pattern.sub(self._adjust_table_structure, content)
 
-    def _adjust_table_structure(self, match: Match[str]) -> str:
+    def _adjust_table_structure(self, match: Match[bytes]) -> bytes:
         """Erstellt eine neue Tabellenstruktur."""
         table_content = self._extract_table_content(match.group(0))
         cols_count = self._calculate_columns(table_content)
         return self._create_adjusted_table(table_content, cols_count)
 
-    def _extract_table_content(self, content: str) -> str:
+    def _extract_table_content(self, content: bytes) -> bytes:
         """Extrahiert den Tabelleninhalt."""
         match = self._table_content_pattern.search(content)
         if not match:
-            return "Inhalt konnte nicht extrahiert werden."
-        return self._minipage_pattern.sub("", match.group(1)).strip()
+            return b"Inhalt konnte nicht extrahiert werden."
+        return self._minipage_pattern.sub(b"", match.group(1)).strip()
 
-    def _calculate_columns(self, content: str) -> int:
+    def _calculate_columns(self, content: bytes) -> int:
         """Berechnet die Anzahl der Spalten."""
-        if "\\\\" not in content:  # Geändert von 'not "\\\\" in content'
+        rows = content.count(b"\\\\")
+        if not rows:
             return 1
-        return content.count("&") // content.count("\\\\") + 1
+        return content.count(b"&") // rows + 1
 
-    def _create_adjusted_table(self, content: str, cols_count: int) -> str:
+    def _create_adjusted_table(self, content: bytes, cols_count: int) -> bytes:
         """Erstellt eine angepasste Tabellenstruktur."""
         return (
-            f'\\begin{{tabular}}{{@{{}}{"l" * cols_count}@{{}}}}\n'
-            "\\toprule\n"
-            f"{content}\n"
-            "\\bottomrule\n"
-            "\\end{tabular}"
+            b"\\begin{tabular}{@{}" + b"l" * cols_count + b"@{}}\n"
+            b"\\toprule\n" + content + b"\n"
+            b"\\bottomrule\n"
+            b"\\end{tabular}"
         )
 
-    def _convert_math_delimiters(self, content: str) -> str:
+    def _convert_math_delimiters(self, content: bytes) -> bytes:
         """Konvertiert mathematische Begrenzer."""
-        return self._math_pattern.sub("$", content)
+        if b"\\(" not in content and b"\\)" not in content:
+            return content
+        return self._math_pattern.sub(b"$", content)
 
-    def _remove_pandoc_bounded(self, content: str) -> str:
+    def _remove_pandoc_bounded(self, content: bytes) -> bytes:
         """Entfernt pandoc-bounded Markierungen."""
-        return self._pandoc_pattern.sub(r"\1", content)
+        if b"\\pandocbounded{" not in content:
+            return content
+        return self._pandoc_pattern.sub(rb"\1", content)
+
+
+# Prozesslokaler Prozessor, wird je Worker einmalig in _init_worker erzeugt
+_worker_processor: LatexProcessor | None = None
+
+
+def _anzahl_worker() -> int:
+    """Ermittelt die Anzahl der Worker-Prozesse (überschreibbar per LATEX_WORKERS)."""
+    return int(os.environ.get("LATEX_WORKERS", os.cpu_count() or 1))
+
+
+def _init_worker(config: Config) -> None:
+    """Erzeugt den LatexProcessor samt kompilierter Muster einmal pro Worker-Prozess."""
+    global _worker_processor
+    _worker_processor = LatexProcessor(config)
+
+
+def _process_in_worker(file_path: Path) -> ManifestEntry | None:
+    """Verarbeitet eine Datei im Worker-Prozess."""
+    assert _worker_processor is not None, "Worker wurde nicht initialisiert"
+    return _worker_processor._process_single_file(file_path)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -314,6 +483,11 @@ def parse_arguments() -> argparse.Namespace:
         default="./tex",
         help="Verzeichnis mit den .tex-Dateien",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Verarbeitet auch Dateien, die seit dem letzten Lauf unverändert sind",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -331,7 +505,7 @@ def main() -> None:
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        config = Config.create_default(args.tex_dir)
+        config = Config.create_default(args.tex_dir, force=args.force)
         processor = LatexProcessor(config)
         processor.process_files()
         logging.info("Verarbeitung erfolgreich abgeschlossen!")
@@ -8,29 +8,77 @@
 
 from typing import List
 
-from graphviz import Digraph
+from graphviz import Source
 
 
-def create_overview() -> Digraph:
+def _quote(text: str) -> str:
     """
-    Erstellt eine strukturierte Übersicht als Digraph-Objekt.
+    Setzt einen Text als DOT-String in Anführungszeichen.
+
+    Args:
+        text: Knoten-ID oder Beschriftung
+
+    Returns:
+        str: Der maskierte DOT-String
+    """
+    return '"' + text.replace('"', '\\"') + '"'
+
+
+def _node(node_id: str, label: str, fillcolor: str) -> str:
+    """
+    Erzeugt die DOT-Zeile für einen Knoten.
+
+    Args:
+        node_id: ID des Knotens
+        label: Beschriftung des Knotens
+        fillcolor: Füllfarbe des Knotens
+
+    Returns:
+        str: Die DOT-Anweisung für den Knoten
+    """
+    return f"\t{_quote(node_id)} [label={_quote(label)} fillcolor={fillcolor}]"
+
+
+def _edge(from_id: str, to_id: str) -> str:
+    """
+    Erzeugt die DOT-Zeile für eine Kante.
+
+    Args:
+        from_id: ID des Startknotens
+        to_id: ID des Zielknotens
 
     Returns:
-        Digraph: Ein konfiguriertes Graphviz-Digraph-Objekt mit der kompletten Übersicht.
+        str: Die DOT-Anweisung für die Kante
     """
-    overview = Digraph(format="svg", graph_attr={"rankdir": "LR", "bgcolor": "white"})
-    overview.attr("node", shape="ellipse", style="filled", fillcolor="lightgrey")
-    return overview
+    return f"\t{_quote(from_id)} -> {_quote(to_id)}"
+
+
+def create_overview() -> List[str]:
+    """
+    Erstellt den Kopf der strukturierten Übersicht als Liste von DOT-Zeilen.
+
+    Die Knoten und Kanten werden als DOT-Text gesammelt und erst beim Rendern
+    zu einer einzigen Quelle zusammengefügt, statt jeden Knoten einzeln über
+    die Digraph-API zu formatieren.
+
+    Returns:
+        List[str]: Die DOT-Zeilen mit den Graph- und Standard-Knotenattributen.
+    """
+    return [
+        "digraph {",
+        "\tgraph [bgcolor=white rankdir=LR]",
+        "\tnode [fillcolor=lightgrey shape=ellipse style=filled]",
+    ]
 
 
-def add_main_nodes(overview: Digraph) -> None:
+def add_main_nodes(overview: List[str]) -> None:
     """
     Fügt die Hauptknoten zum Graphen hinzu.
 
     Args:
-        overview: Das Digraph-Objekt, zu dem die Knoten hinzugefügt werden sollen.
+        overview: Die DOT-Zeilen, zu denen die Knoten hinzugefügt werden sollen.
     """
-    overview.node("root", "Verdichtungsänderung", fillcolor="lightblue")
+    overview.append(_node("root", "Verdichtungsänderung", "lightblue"))
 
     # Erste Ebene: Grundbegriffe
     first_level_nodes = [
@@ -43,16 +91,16 @@ def add_main_nodes(overview: Digraph) -> None:
     ]
 
     for node_id, label in first_level_nodes:
-        overview.node(node_id, label, fillcolor="lightyellow")
-        overview.edge("root", node_id)
+        overview.append(_node(node_id, label, "lightyellow"))
+        overview.append(_edge("root", node_id))
 
 
-def add_detail_nodes(overview: Digraph) -> None:
+def add_detail_nodes(overview: List[str]) -> None:
     """
     Fügt die detaillierten Unterknoten zum Graphen hinzu.
 
     Args:
-        overview: Das Digraph-Objekt, zu dem die Detailknoten hinzugefügt werden sollen.
+        overview: Die DOT-Zeilen, zu denen die Detailknoten hinzugefügt werden sollen.
     """
 
     def add_nodes_and_edges(
@@ -66,9 +114,8 @@ def add_nodes_and_edges(
             nodes: Liste von Tupeln (node_id, label)
             edges: Liste von Tupeln (from_id, to_id) für die Verbindungen
         """
-        for node_id, label in nodes:
-            overview.node(node_id, label, fillcolor="white")
-        overview.edges(edges)
+        overview.extend(_node(node_id, label, "white") for node_id, label in nodes)
+        overview.extend(_edge(from_id, to_id) for from_id, to_id in edges)
 
     # Verdichtung
     verdichtung_nodes = [
@@ -173,8 +220,9 @@ def create_and_save_graph(file_path: str) -> str:
     add_main_nodes(overview)
     add_detail_nodes(overview)
 
-    # Rendern der SVG-Datei
-    overview.render(file_path, format="svg", cleanup=True)
+    # Rendern der SVG-Datei aus der zusammengefügten DOT-Quelle
+    overview.append("}")
+    Source("\n".join(overview) + "\n").render(file_path, format="svg", cleanup=True)
     return file_path
 
 
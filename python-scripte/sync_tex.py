@@ -5,10 +5,13 @@
 Hauptfunktionalitäten:
 1. Synchronisierung aller .tex-Dateien oder einer spezifischen Datei
 2. Benutzerinteraktion zur Auswahl der Synchronisierungsmethode
-3. Sichere Ausführung von rsync-Befehlen
+3. Lokales Kopieren ohne externen Prozess (wie rsync -a nur geänderte Dateien)
+4. Sichere Ausführung von rsync-Befehlen für entfernte Pfade
 
 Hauptkomponenten:
 - sicherer_aufruf: Führt einen Befehl sicher aus und behandelt Fehler
+- kopiere_falls_geaendert: Kopiert eine Datei, wenn Größe oder Änderungszeit abweichen
+- synchronisiere_verzeichnis: Gleicht ein Verzeichnis rekursiv mit dem Ziel ab
 - synchronisiere_tex_dateien: Synchronisiert .tex-Dateien basierend auf der Benutzerauswahl
 - auswahl_und_synchronisierung: Ermöglicht die Benutzerauswahl und führt die Synchronisation durch
 
@@ -18,13 +21,15 @@
 Das Skript führt den Benutzer interaktiv durch den Prozess der Dateiauswahl und Synchronisierung.
 
 Voraussetzungen:
-- rsync muss auf dem System installiert sein
+- rsync nur für entfernte Quell- oder Zielpfade (host:pfad)
 
 Version: 1.0
 Autor: Jan Unger
 Datum: 26.11.2024
 """
 
+import os
+import shutil
 import subprocess
 
 
@@ -38,16 +43,75 @@ def sicherer_aufruf(befehl: list[str]) -> None:
         print(f"Ein unerwarteter Fehler ist aufgetreten: {e}")
 
 
-def synchronisiere_tex_dateien(spezifische_datei: str | None = None) -> None:
+def ist_entfernt(pfad: str) -> bool:
+    """Prüft, ob ein Pfad in rsync-Syntax auf einen entfernten Rechner zeigt (host:pfad)."""
+    kopf = pfad.split("/", 1)[0]
+    return ":" in kopf
+
+
+def kopiere_falls_geaendert(quelle: str, ziel: str) -> bool:
+    """Kopiert eine Datei, wenn Größe oder Änderungszeit abweichen (wie rsync -a).
+
+    shutil.copy2 kopiert unter Linux per os.sendfile im Kernel und übernimmt die
+    Zeitstempel, sodass der nächste Abgleich die Datei als aktuell erkennt.
+
+    Returns:
+        True, wenn kopiert wurde, False, wenn das Ziel bereits aktuell ist.
+    """
+    quell_status = os.stat(quelle)
+    try:
+        ziel_status = os.stat(ziel)
+        if (
+            ziel_status.st_size == quell_status.st_size
+            and ziel_status.st_mtime_ns == quell_status.st_mtime_ns
+        ):
+            return False
+    except FileNotFoundError:
+        pass
+    shutil.copy2(quelle, ziel)
+    print(ziel)
+    return True
+
+
+def synchronisiere_verzeichnis(quelle: str, ziel: str) -> int:
+    """Gleicht den Inhalt von quelle rekursiv mit ziel ab.
+
+    Returns:
+        Anzahl der kopierten Dateien.
+    """
+    kopiert = 0
+    os.makedirs(ziel, exist_ok=True)
+    with os.scandir(quelle) as eintraege:
+        for eintrag in eintraege:
+            ziel_pfad = os.path.join(ziel, eintrag.name)
+            if eintrag.is_dir(follow_symlinks=False):
+                kopiert += synchronisiere_verzeichnis(eintrag.path, ziel_pfad)
+            elif eintrag.is_file(follow_symlinks=False):
+                kopiert += kopiere_falls_geaendert(eintrag.path, ziel_pfad)
+    return kopiert
+
+
+def synchronisiere_tex_dateien(
+    spezifische_datei: str | None = None, quelle: str = "tex", ziel: str = "."
+) -> None:
     """Synchronisiert .tex-Dateien basierend auf der Benutzerauswahl."""
-    befehl = ["rsync", "-avh", "--progress"]
-    if spezifische_datei:
-        vollstaendiger_pfad = "tex/" + spezifische_datei
-        befehl.append(vollstaendiger_pfad)
-    else:
-        befehl.append("tex/")
-    befehl.append(".")
-    sicherer_aufruf(befehl)
+    if ist_entfernt(quelle) or ist_entfernt(ziel):
+        befehl = ["rsync", "-avh", "--progress"]
+        befehl.append(f"{quelle}/{spezifische_datei}" if spezifische_datei else f"{quelle}/")
+        befehl.append(ziel)
+        sicherer_aufruf(befehl)
+        return
+
+    try:
+        if spezifische_datei:
+            quell_pfad = os.path.join(quelle, spezifische_datei)
+            ziel_pfad = os.path.join(ziel, os.path.basename(spezifische_datei))
+            kopiert = int(kopiere_falls_geaendert(quell_pfad, ziel_pfad))
+        else:
+            kopiert = synchronisiere_verzeichnis(quelle, ziel)
+        print(f"{kopiert} Datei(en) synchronisiert.")
+    except OSError as e:
+        print(f"Fehler beim Synchronisieren: {e}")
 
 
 def auswahl_und_synchronisierung() -> None:
@@ -7,14 +7,17 @@
 Hauptfunktionalitäten:
 - Extraktion von Untertiteln aus YouTube-Videos
 - Download der Audiospur, falls keine Untertitel verfügbar sind
-- Transkription der Audiospur mit Whisper
+- Transkription der Audiospur mit Whisper (faster-whisper, int8/float16)
 - Speicherung des extrahierten Textes in einer Datei
 
 Hauptfunktionen:
 - extrahiere_text_aus_video: Hauptfunktion zur Textextraktion aus einem Video
+- extrahiere_batch: Textextraktion aus mehreren Videos parallel
 - hole_untertitel: Versucht, Untertitel aus einem Video zu extrahieren
-- extrahiere_audio: Lädt die Audiospur eines Videos herunter
+- extrahiere_audio: Lädt die Audiospur eines Videos direkt in den Speicher (yt-dlp + FFmpeg)
+- lade_audiodatei: Dekodiert eine Audiodatei zu 16 kHz Mono (soundfile + soxr)
 - transkribiere_audio: Transkribiert eine Audiodatei mit Whisper
+- lade_whisper_modell: Lädt ein Whisper-Modell (zwischengespeichert, GPU falls verfügbar)
 
 Verwendung:
     python youtube_text_extraktor.py
@@ -22,24 +25,40 @@
     Oder als Modul:
     from youtube_text_extraktor import extrahiere_text_aus_video
     text = extrahiere_text_aus_video("VIDEO_URL")
+    texte = extrahiere_batch(["VIDEO_URL_1", "VIDEO_URL_2"])
 
 Voraussetzungen:
 - youtube-transcript-api
-- pytube
-- whisper
+- yt-dlp und FFmpeg (im PATH)
+- faster-whisper
+- numpy
+- soundfile und soxr (für lokale Audiodateien)
 
 Version: 1.0
 Autor: Jan Unger
 Datum: 26.11.2024
 """
 
+import functools
 import os
 import re
-
-import whisper
-from pytube import YouTube
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import ctranslate2
+import numpy as np
+import soundfile as sf
+import soxr
+from faster_whisper import WhisperModel
 from youtube_transcript_api import YouTubeTranscriptApi
 
+# Abtastrate, die Whisper erwartet
+ABTASTRATE = 16000
+
+# Begrenzt gleichzeitige Whisper-Transkriptionen (CPU-/GPU-gebunden) im Batch-Betrieb
+TRANSKRIPTIONS_SPERRE = threading.BoundedSemaphore(1)
+
 
 def prüfe_url(url: str) -> bool:
     """
@@ -88,33 +107,78 @@ def hole_untertitel(video_id: str) -> str | None:
             return None
 
 
-def extrahiere_audio(url: str, ausgabepfad: str = "audio.mp3") -> str | None:
-    """Lädt die Audiospur herunter"""
+def extrahiere_audio(url: str) -> np.ndarray | None:
+    """Lädt die Audiospur als 16-kHz-Mono-Signal direkt in den Speicher
+
+    yt-dlp streamt die Audiospur nach stdout, FFmpeg dekodiert sie aus der Pipe zu
+    16-Bit-PCM; eine temporäre Audiodatei entfällt.
+    """
     try:
-        yt = YouTube(url)
-        print(f"Verarbeite Video: {yt.title}")
-        video = yt.streams.filter(only_audio=True).order_by("abr").desc().first()
-        if not video:
-            raise Exception("Kein Audio-Stream gefunden")
-        if os.path.exists(ausgabepfad):
-            os.remove(ausgabepfad)
         print("Lade Audio herunter...")
-        video.download(filename=ausgabepfad)
-        return ausgabepfad
+        download = subprocess.Popen(
+            ["yt-dlp", "--quiet", "-f", "bestaudio", "-o", "-", url],
+            stdout=subprocess.PIPE,
+        )
+        try:
+            dekoder = subprocess.Popen(
+                ["ffmpeg", "-loglevel", "error", "-i", "pipe:0"]
+                + ["-f", "s16le", "-ac", "1", "-ar", str(ABTASTRATE), "pipe:1"],
+                stdin=download.stdout,
+                stdout=subprocess.PIPE,
+            )
+            # Eigenes Pipe-Ende schließen, damit yt-dlp ein Abbrechen von FFmpeg bemerkt
+            assert download.stdout is not None
+            download.stdout.close()
+            pcm, _ = dekoder.communicate()
+            if download.wait() != 0 or dekoder.returncode != 0:
+                raise Exception("yt-dlp oder FFmpeg meldeten einen Fehler")
+            if not pcm:
+                raise Exception("Kein Audio-Stream gefunden")
+            return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        finally:
+            # yt-dlp nicht verwaisen lassen, falls FFmpeg nicht startet oder abbricht
+            if download.poll() is None:
+                download.kill()
+            download.wait()
     except Exception as e:
         print(f"Fehler beim Herunterladen des Audios: {e}")
         return None
 
 
-def transkribiere_audio(audio_pfad: str) -> str | None:
-    """Transkribiert eine Audiodatei"""
+@functools.lru_cache(maxsize=4)
+def lade_whisper_modell(name: str = "base") -> WhisperModel:
+    """Lädt ein Whisper-Modell einmalig und hält es für weitere Aufrufe vor"""
+    # int8 auf der CPU, float16 auf der GPU
+    gpu = ctranslate2.get_cuda_device_count() > 0
+    device, compute_type = ("cuda", "float16") if gpu else ("cpu", "int8")
+    print(f"Lade Whisper Modell '{name}' ({device}, {compute_type})...")
+    return WhisperModel(name, device=device, compute_type=compute_type)
+
+
+def lade_audiodatei(audio_pfad: str) -> np.ndarray:
+    """Dekodiert eine Audiodatei im Prozess zu einem 16-kHz-Mono-Signal (float32)
+
+    Ersetzt den FFmpeg-Aufruf, den Whisper für jeden Dateipfad startet.
+    """
+    daten, abtastrate = sf.read(audio_pfad, dtype="float32")
+    if daten.ndim == 2:
+        daten = daten.mean(axis=1)
+    if abtastrate != ABTASTRATE:
+        daten = soxr.resample(daten, abtastrate, ABTASTRATE)
+    return np.asarray(daten, dtype=np.float32)
+
+
+def transkribiere_audio(audio: str | np.ndarray) -> str | None:
+    """Transkribiert eine Audiodatei oder ein 16-kHz-Mono-Signal"""
     try:
-        print("Lade Whisper Modell...")
-        model = whisper.load_model("base")
-        print("Transkribiere Audio...")
-        ergebnis = model.transcribe(audio_pfad, language="de")
-        text: str = ergebnis["text"]
-        return text
+        if isinstance(audio, str):
+            audio = lade_audiodatei(audio)
+        # Transkription ist rechenintensiv und läuft daher nie parallel
+        with TRANSKRIPTIONS_SPERRE:
+            model = lade_whisper_modell("base")
+            print("Transkribiere Audio...")
+            segmente, _ = model.transcribe(audio, language="de")
+            return " ".join(segment.text.strip() for segment in segmente)
     except Exception as e:
         print(f"Fehler bei der Transkription: {e}")
         return None
@@ -132,13 +196,10 @@ def extrahiere_text_aus_video(url: str) -> str:
             print("✓ Untertitel erfolgreich geladen!")
             return text
         print("Keine Untertitel gefunden. Starte Audio-Download...")
-        audio_pfad = extrahiere_audio(url)
-        if not audio_pfad:
+        audio = extrahiere_audio(url)
+        if audio is None:
             raise Exception("Audio konnte nicht heruntergeladen werden")
-        text = transkribiere_audio(audio_pfad)
-        if os.path.exists(audio_pfad):
-            os.remove(audio_pfad)
-            print("✓ Audio-Datei aufgeräumt")
+        text = transkribiere_audio(audio)
         if not text:
             raise Exception("Transkription fehlgeschlagen")
         return text
@@ -146,6 +207,12 @@ def extrahiere_text_aus_video(url: str) -> str:
         return f"Fehler bei der Textextraktion: {e}"
 
 
+def extrahiere_batch(urls: list[str], max_workers: int = 8) -> dict[str, str]:
+    """Extrahiert den Text mehrerer Videos; Netzwerkzugriffe laufen parallel in Threads"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(extrahiere_text_aus_video, urls)))
+
+
 def speichere_text(text: str, ausgabedatei: str = "youtube_transkript.txt") -> None:
     """Speichert den Text in eine Datei"""
     try:
@@ -3,7 +3,7 @@
 Skript bietet ein Menü zur Auswahl und Ausführung von Befehlen für LaTeX und HTML.
 
 Hauptfunktionalitäten:
-1. Konfiguration über YAML-Datei
+1. Konfiguration über YAML-Datei (INPROCESS: Python-Skripte ohne eigenen Interpreter ausführen)
 2. Interaktives Menü zur Befehlsauswahl
 3. Ausführung von LaTeX-bezogenen Befehlen
 4. Ausführung von HTML-bezogenen Befehlen
@@ -11,16 +11,20 @@
 
 Hauptkomponenten:
 - load_config: Lädt die Konfiguration aus einer YAML-Datei
+- lade_befehle: Lädt die Konfiguration einmalig und baut die Befehlstabellen und das Menü
 - sicherer_aufruf: Führt Befehle sicher aus und behandelt Fehler
 - zeige_menue_und_waehle: Zeigt das Menü und verarbeitet die Benutzerauswahl
 - kombinierte_latex_verarbeitung: Führt eine Sequenz von LaTeX-Befehlen aus
 - kombinierte_html_verarbeitung: Führt eine Sequenz von HTML-Befehlen aus
+- fuehre_schritte_aus: Führt Befehle nach Abhängigkeiten aus, unabhängige parallel
 
 Verwendung:
-    python scriptauswahl.py [--config PFAD_ZUR_CONFIG]
+    python scriptauswahl.py [--config PFAD_ZUR_CONFIG] [--log LOGDATEI]
 
 Args:
     --config: Optionaler Pfad zur Konfigurationsdatei (Standard: config.yaml)
+    --log: Optionale Logdatei, an die die Ausgabe der externen Befehle angehängt wird
+        (interaktive Befehle wie SYNC_TEX_FILES bleiben im Terminal)
 
 Die Konfigurationsdatei sollte Befehle für LaTeX- und HTML-Verarbeitung enthalten.
 
@@ -35,12 +39,34 @@
 """
 
 import argparse
+import asyncio
+import functools
+import json
 import logging
+import os
+import runpy
+import shlex
+import shutil
 import subprocess
-from typing import Callable, Dict, List, Optional, Union
+import sys
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Union
 
 import yaml
 
+# Zeilen-Editor mit Verlauf und Tab-Vervollständigung (nicht auf allen Plattformen vorhanden)
+try:
+    import readline
+except ImportError:
+    readline = None  # type: ignore[assignment]
+
+# C-Parser (libyaml), falls PyYAML damit gebaut wurde
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 # Logging-Konfiguration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -50,9 +76,11 @@
 
 
 # Lade Konfiguration aus YAML-Datei
-def load_config(config_path: str) -> dict[str, list[str]]:
-    with open(config_path, "r") as config_file:
-        config = yaml.safe_load(config_file)
+def _parse_config(config_path: str) -> dict[str, list[str]]:
+    """Liest die YAML-Datei und übernimmt nur Einträge mit Listen von Strings."""
+    # libyaml liest die Bytes selbst und erkennt die Kodierung, ein Dekodieren in Python entfällt
+    with open(config_path, "rb") as config_file:
+        config = yaml.load(config_file, Loader=SafeLoader)
         # Typisiertes Dictionary erstellen
         result: dict[str, list[str]] = {}
         for key, value in config.items():
@@ -61,39 +89,129 @@ def load_config(config_path: str) -> dict[str, list[str]]:
         return result
 
 
-CONFIG = load_config("config.yaml")
+def load_config(config_path: str) -> Mapping[str, list[str]]:
+    """
+    Lädt die Konfiguration; wiederholte Aufrufe im selben Prozess kosten nur ein stat.
+
+    Das Ergebnis ist nach absolutem Pfad und Änderungszeit zwischengespeichert und wird
+    daher schreibgeschützt zurückgegeben, damit kein Aufrufer den Cache verändert.
+
+    Args:
+        config_path (str): Pfad zur YAML-Konfigurationsdatei.
+
+    Returns:
+        Mapping[str, list[str]]: Alle Einträge, deren Wert eine Liste von Strings ist.
+    """
+    return _load_cached(os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(config_path: str, mtime_ns: int) -> Mapping[str, list[str]]:
+    """
+    Lädt die Konfiguration und speichert das Ergebnis als JSON neben der YAML-Datei.
+
+    Solange sich die Änderungszeit der YAML-Datei nicht ändert, wird der Zwischenspeicher
+    gelesen und der (deutlich langsamere) YAML-Parser übersprungen.
+    """
+    cache_path = config_path + ".cache.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        if cache["mtime_ns"] == mtime_ns:
+            return MappingProxyType(cache["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    result = _parse_config(config_path)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"mtime_ns": mtime_ns, "config": result}, cache_file)
+    except OSError as e:
+        logging.warning("Konfigurations-Cache konnte nicht geschrieben werden: %s", e)
+    return MappingProxyType(result)
+
+
+# Konfiguration und Befehlstabellen werden erst in main() (lade_befehle) befüllt, damit die
+# YAML-Datei pro Lauf nur einmal und nur mit dem tatsächlich gewählten Pfad geladen wird
+CONFIG: Mapping[str, list[str]] = MappingProxyType({})
+
+# Python-Skripte, die laut Konfiguration (INPROCESS) ohne eigenen Interpreter laufen
+INPROCESS_SKRIPTE: set[str] = set()
+# sys.argv ist prozessweit, daher laufen In-Process-Skripte nie gleichzeitig
+_INPROCESS_SPERRE = threading.Lock()
+# Deskriptor der Logdatei (--log), in die Kindprozesse direkt schreiben; None = Terminal
+_AUSGABE_FD: Optional[int] = None
+# Konfigurationsschlüssel von Befehlen mit Benutzereingaben; ihre Ausgabe bleibt auch mit --log
+# im Terminal, sonst landen die Eingabeaufforderungen in der Logdatei und das Menü hängt
+INTERAKTIVE_BEFEHLE = ("SYNC_TEX_FILES",)
+_INTERAKTIV: set[tuple[str, ...]] = set()
 
 # Gruppierte Konstanten für Befehle
-LATEX_COMMANDS = {
-    "KONVERTIEREN": CONFIG["LATEX_KONVERTIEREN"],
-    "ENTFERNEN": CONFIG["LATEX_ENTFERNEN"],
-    "SUCHEN_ERSETZEN": CONFIG["LATEX_SUCHEN_ERSETZEN"],
-    "SYNC_TEX_FILES": CONFIG["SYNC_TEX_FILES"],
-}
+LATEX_COMMANDS: Dict[str, List[str]] = {}
+MAKE_COMMANDS: Dict[str, List[str]] = {}
+HTML_COMMANDS: Dict[str, List[str]] = {}
 
-MAKE_COMMANDS = {
-    "DEFAULT": CONFIG["MAKE"],
-    "XELATEX": CONFIG["MAKE_XELATEX"],
-    "LUALATEX": CONFIG["MAKE_LUALATEX"],
-    "CLEAN": CONFIG["MAKE_CLEAN"],
-    "CLEAN_PDF": CONFIG["MAKE_CLEAN_PDF"],
-}
 
-HTML_COMMANDS = {
-    "PANDOC": CONFIG["HTML_PANDOC"],
-    "NAVIGATION": CONFIG["HTML_NAVIGATION"],
-    "ENTFERNEN": CONFIG["HTML_ENTFERNEN"],
+# Abhängigkeiten der HTML-Schritte: Navigation (liest nur die Dateinamen in html/) und
+# Bildpfad-Korrektur (ändert nur Dateiinhalte) benötigen beide nur die Pandoc-Ausgabe
+HTML_SCHRITTE: Dict[str, List[str]] = {
+    "PANDOC": [],  # MD -> HTML mit Template
+    "NAVIGATION": ["PANDOC"],  # Erstellt Navigation
+    "ENTFERNEN": ["PANDOC"],  # Bildpfade korrigieren
 }
 
 
+def fuehre_schritte_aus(
+    befehle: Mapping[str, List[str]], abhaengigkeiten: Mapping[str, List[str]]
+) -> bool:
+    """
+    Führt Befehle nach ihren Abhängigkeiten aus, unabhängige Schritte parallel.
+
+    Ein Schritt startet, sobald alle seine Vorgänger erfolgreich waren; schlägt ein
+    Vorgänger fehl, wird er übersprungen. Vorgänger müssen in abhaengigkeiten vor dem
+    Schritt stehen. Mit der Umgebungsvariable SCRIPTAUSWAHL_SEQUENTIELL=1 laufen die
+    Schritte zur Fehlersuche nacheinander.
+
+    Args:
+        befehle: Schrittname -> auszuführender Befehl
+        abhaengigkeiten: Schrittname -> Namen der vorausgesetzten Schritte
+
+    Returns:
+        bool: True, wenn alle Schritte erfolgreich ausgeführt wurden.
+    """
+    bekannt: set[str] = set()
+    for name, vorgaenger in abhaengigkeiten.items():
+        unbekannt = [v for v in vorgaenger if v not in bekannt]
+        if unbekannt:
+            logging.error("Nicht auflösbare Abhängigkeiten für %s: %s", name, ", ".join(unbekannt))
+            return False
+        bekannt.add(name)
+    sequentiell = os.environ.get("SCRIPTAUSWAHL_SEQUENTIELL") == "1"
+    return asyncio.run(_fuehre_schritte_async(befehle, abhaengigkeiten, sequentiell))
+
+
+async def _fuehre_schritte_async(
+    befehle: Mapping[str, List[str]], abhaengigkeiten: Mapping[str, List[str]], sequentiell: bool
+) -> bool:
+    """Startet jeden Schritt als Task, der auf die Tasks seiner Vorgänger wartet."""
+    sperre = asyncio.Semaphore(1 if sequentiell else max(1, len(abhaengigkeiten)))
+    aufgaben: Dict[str, asyncio.Task[bool]] = {}
+
+    async def schritt(name: str) -> bool:
+        ergebnisse = await asyncio.gather(*(aufgaben[v] for v in abhaengigkeiten[name]))
+        if not all(ergebnisse):
+            logging.error("Übersprungen wegen fehlgeschlagener Abhängigkeit: %s", name)
+            return False
+        async with sperre:
+            return await _async_aufruf(befehle[name])
+
+    for name in abhaengigkeiten:
+        aufgaben[name] = asyncio.create_task(schritt(name))
+    return all(await asyncio.gather(*aufgaben.values()))
+
+
 def kombinierte_html_verarbeitung() -> None:
-    for befehl in [
-        HTML_COMMANDS["PANDOC"],  # MD -> HTML mit Template
-        HTML_COMMANDS["NAVIGATION"],  # Erstellt Navigation
-        HTML_COMMANDS["ENTFERNEN"],  # Bildpfade korrigieren
-    ]:
-        if isinstance(befehl, list):
-            sicherer_aufruf(befehl)
+    fuehre_schritte_aus(HTML_COMMANDS, HTML_SCHRITTE)
 
 
 def sicherer_aufruf(befehl: List[str]) -> bool:
@@ -106,18 +224,87 @@ def sicherer_aufruf(befehl: List[str]) -> bool:
     Returns:
         bool: True, wenn der Befehl erfolgreich ausgeführt wurde, sonst False.
     """
-    logging.info(f"Ausführender Befehl: {' '.join(befehl)}")
+    return asyncio.run(_async_aufruf(befehl))
+
+
+class _Befehlszeile:
+    """Formatiert einen Befehl erst, wenn die Lognachricht tatsächlich ausgegeben wird."""
+
+    __slots__ = ("befehl",)
+
+    def __init__(self, befehl: List[str]):
+        self.befehl = befehl
+
+    def __str__(self) -> str:
+        return shlex.join(self.befehl)
+
+
+async def _async_aufruf(befehl: List[str]) -> bool:
+    """
+    Führt einen Befehl als asynchronen Kindprozess aus; Fehlerbehandlung wie sicherer_aufruf.
+
+    Während auf den Prozess gewartet wird, laufen andere Schritte in der Ereignisschleife weiter.
+    """
+    logging.info("Ausführender Befehl: %s", _Befehlszeile(befehl))
+    if len(befehl) > 1 and befehl[1] in INPROCESS_SKRIPTE:
+        return await asyncio.to_thread(_fuehre_skript_aus, befehl[1], befehl[2:])
+    ausgabe_fd = None if tuple(befehl) in _INTERAKTIV else _AUSGABE_FD
     try:
-        subprocess.run(befehl, check=True)
+        if ausgabe_fd is not None:
+            os.write(ausgabe_fd, f"$ {shlex.join(befehl)}\n".encode())
+        # close_fds=False erlaubt CPython den schnellen Start per posix_spawn statt fork/exec
+        # (zusammen mit dem absoluten Programmpfad); eigene Deskriptoren sind nach PEP 446
+        # ohnehin nicht vererbbar
+        prozess = await asyncio.create_subprocess_exec(
+            *befehl,
+            close_fds=False,
+            stdout=ausgabe_fd,
+            stderr=None if ausgabe_fd is None else subprocess.STDOUT,
+        )
+        returncode = await prozess.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, befehl)
         return True
     except subprocess.CalledProcessError as e:
-        logging.error(f"Fehler beim Ausführen des Befehls: {e}")
+        logging.error("Fehler beim Ausführen des Befehls: %s", e)
     except FileNotFoundError as e:
-        logging.error(f"Befehl nicht gefunden: {e}")
+        logging.error("Befehl nicht gefunden: %s", e)
     except PermissionError as e:
-        logging.error(f"Keine Berechtigung zur Ausführung des Befehls: {e}")
+        logging.error("Keine Berechtigung zur Ausführung des Befehls: %s", e)
     except Exception as e:
-        logging.error(f"Ein unerwarteter Fehler ist aufgetreten: {e}")
+        logging.error("Ein unerwarteter Fehler ist aufgetreten: %s", e)
+    return False
+
+
+def _fuehre_skript_aus(skript: str, argumente: List[str]) -> bool:
+    """
+    Führt ein Python-Skript im laufenden Interpreter aus, als wäre es direkt aufgerufen.
+
+    Spart Start und Importe eines neuen Interpreters; ein Exit-Code ungleich 0 über
+    sys.exit gilt wie beim Kindprozess als Fehler.
+
+    Args:
+        skript: Pfad zum Python-Skript
+        argumente: Kommandozeilenargumente für das Skript
+
+    Returns:
+        bool: True, wenn das Skript erfolgreich ausgeführt wurde, sonst False.
+    """
+    with _INPROCESS_SPERRE:
+        alte_argv, alter_pfad = sys.argv, sys.path[:]
+        sys.argv = [skript, *argumente]
+        sys.path.insert(0, os.path.dirname(os.path.abspath(skript)))
+        try:
+            runpy.run_path(skript, run_name="__main__")
+            return True
+        except SystemExit as e:
+            if e.code in (None, 0):
+                return True
+            logging.error("Fehler beim Ausführen von %s: Exit-Status %s", skript, e.code)
+        except Exception as e:
+            logging.error("Ein unerwarteter Fehler ist aufgetreten: %s", e)
+        finally:
+            sys.argv, sys.path[:] = alte_argv, alter_pfad
     return False
 
 
@@ -128,9 +315,7 @@ def zeige_menue_und_waehle() -> Optional[str]:
     Returns:
         Optional[str]: Die Auswahl des Benutzers oder None, wenn 'q' gewählt wurde.
     """
-    print("\nBitte wählen Sie einen Befehl aus:\n")
-    for key, value in BEFEHLE.items():
-        print(f"{key}. {value['name']}")
+    sys.stdout.write(_MENU_TEXT)
     auswahl = input("\nGeben Sie die Nummer des gewünschten Befehls ein oder 'q' zum Beenden: ")
     return None if auswahl == "q" else auswahl
 
@@ -142,7 +327,7 @@ def pause() -> None:
 
 def verarbeite_alle_tex_dateien() -> None:
     """Automatisierte Version zum Synchronisieren aller .tex-Dateien."""
-    befehl = ["rsync", "-avh", "--progress", "tex/", "."]
+    befehl = mit_programmpfad(["rsync", "-avh", "--progress", "tex/", "."])
     if sicherer_aufruf(befehl):
         logging.info("Alle .tex-Dateien wurden synchronisiert.")
     else:
@@ -161,15 +346,15 @@ def kombinierte_latex_verarbeitung() -> None:
     ]
 
     for befehl, beschreibung in schritte:
-        logging.info(f"Führe aus: {beschreibung}")
+        logging.info("Führe aus: %s", beschreibung)
         if isinstance(befehl, list):
             if not sicherer_aufruf(befehl):
-                logging.error(f"Fehler bei: {beschreibung}")
+                logging.error("Fehler bei: %s", beschreibung)
                 return
         elif callable(befehl):
             befehl()
         else:
-            logging.error(f"Ungültiger Befehlstyp für: {beschreibung}")
+            logging.error("Ungültiger Befehlstyp für: %s", beschreibung)
             return
 
     logging.info("Kombinierte LaTeX Verarbeitung abgeschlossen.")
@@ -187,49 +372,149 @@ def fuehre_befehl_aus(befehl: Union[List[str], Callable[[], None]]) -> None:
     elif isinstance(befehl, list):
         sicherer_aufruf(befehl)
     else:
-        logging.error(f"Ungültiger Befehlstyp: {type(befehl)}")
-
-
-BEFEHLE: Dict[str, BefehlsEintrag] = {
-    "1": {"name": "LaTeX konvertieren", "command": LATEX_COMMANDS["KONVERTIEREN"]},
-    "2": {
-        "name": "LaTeX Code entfernen (Alle Dateien)",
-        "command": LATEX_COMMANDS["ENTFERNEN"],
-    },
-    "3": {
-        "name": "LaTeX Code Suchen und Ersetzen",
-        "command": LATEX_COMMANDS["SUCHEN_ERSETZEN"],
-    },
-    "4": {
-        "name": "Synchronisiere .tex-Dateien mit Auswahl einer Datei oder allen",
-        "command": LATEX_COMMANDS["SYNC_TEX_FILES"],
-    },
-    "5": {
-        "name": "Kombi Latex (Schritte 1-4+7)",
-        "command": kombinierte_latex_verarbeitung,
-    },
-    "6": {"name": "make (# pdflatex)", "command": MAKE_COMMANDS["DEFAULT"]},
-    "7": {"name": "make xelatex", "command": MAKE_COMMANDS["XELATEX"]},
-    "8": {"name": "make lualatex", "command": MAKE_COMMANDS["LUALATEX"]},
-    "9": {"name": "make clean - aufräumen ohne PDFs", "command": MAKE_COMMANDS["CLEAN"]},
-    "10": {
-        "name": "make clean-pdf - aufräumen mit PDFs",
-        "command": MAKE_COMMANDS["CLEAN_PDF"],
-    },
-    "11": {
-        "name": "Markdown in HTML Konvertierung mit Pandoc",
-        "command": HTML_COMMANDS["PANDOC"],
-    },
-    "12": {
-        "name": "Navigation über HTML Seiten erstellen",
-        "command": HTML_COMMANDS["NAVIGATION"],
-    },
-    "13": {"name": "HTML Code entfernen", "command": HTML_COMMANDS["ENTFERNEN"]},
-    "14": {
-        "name": "Kombi HTML (Schritte 11-13)",
-        "command": kombinierte_html_verarbeitung,
-    },
-}
+        logging.error("Ungültiger Befehlstyp: %s", type(befehl))
+
+
+BEFEHLE: Dict[str, BefehlsEintrag] = {}
+# Menütext, einmalig in lade_befehle aus BEFEHLE erzeugt
+_MENU_TEXT = ""
+
+
+@functools.lru_cache(maxsize=None)
+def finde_programm(name: str) -> str:
+    """Löst einen Programmnamen einmalig über PATH zu einem absoluten Pfad auf."""
+    return shutil.which(name) or name
+
+
+def mit_programmpfad(befehl: List[str]) -> List[str]:
+    """
+    Ersetzt das Programm eines Befehls durch seinen absoluten Pfad.
+
+    Der Kindprozess wird dann direkt gestartet, ohne dass bei jedem Aufruf die
+    PATH-Verzeichnisse durchsucht werden. Unbekannte Programme bleiben unverändert,
+    damit der Fehler wie bisher beim Aufruf gemeldet wird.
+    """
+    return [finde_programm(befehl[0]), *befehl[1:]] if befehl else befehl
+
+
+def _aus_config(key: str) -> List[str]:
+    """Liefert den Befehl zu einem Konfigurationsschlüssel mit absolutem Programmpfad."""
+    return mit_programmpfad(CONFIG[key])
+
+
+def lade_befehle(config_path: str) -> None:
+    """
+    Lädt die Konfiguration und baut daraus die Befehlstabellen und das Menü.
+
+    Args:
+        config_path (str): Pfad zur YAML-Konfigurationsdatei.
+    """
+    global CONFIG, _MENU_TEXT
+    CONFIG = load_config(config_path)
+    _lade_ausfuehrungsarten()
+    _lade_befehlstabellen()
+    _lade_menue()
+    _MENU_TEXT = (
+        "\nBitte wählen Sie einen Befehl aus:\n\n"
+        + "\n".join(f"{key}. {value['name']}" for key, value in BEFEHLE.items())
+        + "\n"
+    )
+
+
+def _lade_ausfuehrungsarten() -> None:
+    """Übernimmt In-Process-Skripte (INPROCESS) und interaktive Befehle aus CONFIG."""
+    INPROCESS_SKRIPTE.update(
+        CONFIG[key][1] for key in CONFIG.get("INPROCESS", []) if len(CONFIG.get(key, [])) > 1
+    )
+    _INTERAKTIV.update(tuple(_aus_config(key)) for key in INTERAKTIVE_BEFEHLE if key in CONFIG)
+
+
+def _lade_befehlstabellen() -> None:
+    """Füllt LATEX_COMMANDS, MAKE_COMMANDS und HTML_COMMANDS aus CONFIG."""
+    LATEX_COMMANDS.update(
+        {
+            "KONVERTIEREN": _aus_config("LATEX_KONVERTIEREN"),
+            "ENTFERNEN": _aus_config("LATEX_ENTFERNEN"),
+            "SUCHEN_ERSETZEN": _aus_config("LATEX_SUCHEN_ERSETZEN"),
+            "SYNC_TEX_FILES": _aus_config("SYNC_TEX_FILES"),
+        }
+    )
+    MAKE_COMMANDS.update(
+        {
+            "DEFAULT": _aus_config("MAKE"),
+            "XELATEX": _aus_config("MAKE_XELATEX"),
+            "LUALATEX": _aus_config("MAKE_LUALATEX"),
+            "CLEAN": _aus_config("MAKE_CLEAN"),
+            "CLEAN_PDF": _aus_config("MAKE_CLEAN_PDF"),
+        }
+    )
+    HTML_COMMANDS.update(
+        {
+            "PANDOC": _aus_config("HTML_PANDOC"),
+            "NAVIGATION": _aus_config("HTML_NAVIGATION"),
+            "ENTFERNEN": _aus_config("HTML_ENTFERNEN"),
+        }
+    )
+
+
+def _lade_menue() -> None:
+    """Füllt BEFEHLE mit den Menüeinträgen."""
+    BEFEHLE.update(
+        {
+            "1": {"name": "LaTeX konvertieren", "command": LATEX_COMMANDS["KONVERTIEREN"]},
+            "2": {
+                "name": "LaTeX Code entfernen (Alle Dateien)",
+                "command": LATEX_COMMANDS["ENTFERNEN"],
+            },
+            "3": {
+                "name": "LaTeX Code Suchen und Ersetzen",
+                "command": LATEX_COMMANDS["SUCHEN_ERSETZEN"],
+            },
+            "4": {
+                "name": "Synchronisiere .tex-Dateien mit Auswahl einer Datei oder allen",
+                "command": LATEX_COMMANDS["SYNC_TEX_FILES"],
+            },
+            "5": {
+                "name": "Kombi Latex (Schritte 1-4+7)",
+                "command": kombinierte_latex_verarbeitung,
+            },
+            "6": {"name": "make (# pdflatex)", "command": MAKE_COMMANDS["DEFAULT"]},
+            "7": {"name": "make xelatex", "command": MAKE_COMMANDS["XELATEX"]},
+            "8": {"name": "make lualatex", "command": MAKE_COMMANDS["LUALATEX"]},
+            "9": {"name": "make clean - aufräumen ohne PDFs", "command": MAKE_COMMANDS["CLEAN"]},
+            "10": {
+                "name": "make clean-pdf - aufräumen mit PDFs",
+                "command": MAKE_COMMANDS["CLEAN_PDF"],
+            },
+            "11": {
+                "name": "Markdown in HTML Konvertierung mit Pandoc",
+                "command": HTML_COMMANDS["PANDOC"],
+            },
+            "12": {
+                "name": "Navigation über HTML Seiten erstellen",
+                "command": HTML_COMMANDS["NAVIGATION"],
+            },
+            "13": {"name": "HTML Code entfernen", "command": HTML_COMMANDS["ENTFERNEN"]},
+            "14": {
+                "name": "Kombi HTML (Schritte 11-13)",
+                "command": kombinierte_html_verarbeitung,
+            },
+        }
+    )
+
+
+def richte_eingabe_ein() -> None:
+    """Aktiviert Verlauf (Pfeil hoch) und Tab-Vervollständigung der Menüauswahl."""
+    if readline is None:
+        return
+    auswahlen = [*BEFEHLE, "q"]
+
+    def vervollstaendige(text: str, zustand: int) -> Optional[str]:
+        treffer = [auswahl for auswahl in auswahlen if auswahl.startswith(text)]
+        return treffer[zustand] if zustand < len(treffer) else None
+
+    readline.set_completer(vervollstaendige)
+    readline.parse_and_bind("tab: complete")
 
 
 def main() -> None:
@@ -237,28 +522,40 @@ def main() -> None:
         description="Interaktives Skript zur Ausführung verschiedener Befehle."
     )
     parser.add_argument("--config", default="config.yaml", help="Pfad zur Konfigurationsdatei")
+    parser.add_argument(
+        "--log",
+        help="Ausgabe der externen Befehle an diese Datei anhängen statt im Terminal anzuzeigen",
+    )
     args = parser.parse_args()
 
-    global CONFIG
-    CONFIG = load_config(args.config)
-
-    while True:
-        auswahl = zeige_menue_und_waehle()
-        if auswahl is None:
-            break
-        if auswahl in BEFEHLE:
-            logging.info("\n" + "=" * 50)
-            befehl = BEFEHLE[auswahl]["command"]
-            if isinstance(befehl, list):
-                sicherer_aufruf(befehl)
-            elif callable(befehl):
-                befehl()
+    lade_befehle(args.config)
+    richte_eingabe_ein()
+
+    global _AUSGABE_FD
+    if args.log:
+        _AUSGABE_FD = os.open(args.log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        while True:
+            auswahl = zeige_menue_und_waehle()
+            if auswahl is None:
+                break
+            if auswahl in BEFEHLE:
+                logging.info("\n" + "=" * 50)
+                befehl = BEFEHLE[auswahl]["command"]
+                if isinstance(befehl, list):
+                    sicherer_aufruf(befehl)
+                elif callable(befehl):
+                    befehl()
+                else:
+                    logging.error("Ungültiger Befehlstyp für Auswahl %s", auswahl)
+                logging.info("=" * 50)
+                pause()
             else:
-                logging.error(f"Ungültiger Befehlstyp für Auswahl {auswahl}")
-            logging.info("=" * 50)
-            pause()
-        else:
-            logging.warning("Ungültige Auswahl. Bitte erneut versuchen.")
+                logging.warning("Ungültige Auswahl. Bitte erneut versuchen.")
+    finally:
+        if _AUSGABE_FD is not None:
+            os.close(_AUSGABE_FD)
+            _AUSGABE_FD = None
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Konfigurationsdatei für Pytest Fixtures und Plugins."""
 
+import ast
+import os
 from pathlib import Path
 from typing import Dict, List
 
@@ -12,15 +14,49 @@ def project_root() -> Path:
 
 
 @pytest.fixture(scope="session")
-def python_files(project_root: Path) -> List[Path]:
-    return list(project_root.glob("python-scripte/*.py"))
+def _all_files(project_root: Path) -> Dict[str, List[Path]]:
+    # Ein einziger Durchlauf über den Projektbaum, nach Dateiendung sortiert
+    out: Dict[str, List[Path]] = {".py": [], ".md": [], ".tex": [], ".yaml": []}
+    for root, dirs, files in os.walk(project_root):
+        if ".git" in dirs:
+            dirs.remove(".git")
+        for name in files:
+            out.setdefault(os.path.splitext(name)[1], []).append(Path(root) / name)
+    return out
 
 
 @pytest.fixture(scope="session")
-def config_files(project_root: Path) -> List[Path]:
-    return list(project_root.glob("*.yaml"))
+def python_files(project_root: Path, _all_files: Dict[str, List[Path]]) -> List[Path]:
+    scripts_dir = project_root / "python-scripte"
+    return [path for path in _all_files[".py"] if path.parent == scripts_dir]
 
 
 @pytest.fixture(scope="session")
-def doc_files(project_root: Path) -> Dict[str, List[Path]]:
-    return {"md": list(project_root.glob("**/*.md")), "tex": list(project_root.glob("**/*.tex"))}
+def python_sources(python_files: List[Path]) -> Dict[Path, str]:
+    return {py_file: py_file.read_text(encoding="utf-8") for py_file in python_files}
+
+
+class _AstCache(Dict[Path, ast.Module]):
+    # Parst jede Datei erst beim ersten Zugriff, ein Syntaxfehler trifft so nur deren Tests
+    def __init__(self, sources: Dict[Path, str]) -> None:
+        super().__init__()
+        self._sources = sources
+
+    def __missing__(self, py_file: Path) -> ast.Module:
+        tree = self[py_file] = ast.parse(self._sources[py_file], str(py_file))
+        return tree
+
+
+@pytest.fixture(scope="session")
+def python_asts(python_sources: Dict[Path, str]) -> Dict[Path, ast.Module]:
+    return _AstCache(python_sources)
+
+
+@pytest.fixture(scope="session")
+def config_files(project_root: Path, _all_files: Dict[str, List[Path]]) -> List[Path]:
+    return [path for path in _all_files[".yaml"] if path.parent == project_root]
+
+
+@pytest.fixture(scope="session")
+def doc_files(_all_files: Dict[str, List[Path]]) -> Dict[str, List[Path]]:
+    return {"md": _all_files[".md"], "tex": _all_files[".tex"]}